@@ -7,6 +7,14 @@ Creates detailed implementations with 300-600 lines per pattern.
 import os
 import sys
 
+# Patterns are generated next to this script, i.e. into Java/Integration.
+BASE_PATH = os.path.dirname(os.path.abspath(__file__))
+
+# Console banner edges printed by main()
+_BANNER_TOP = "╔" + "═" * 70 + "╗"
+_BANNER_BOTTOM = "╚" + "═" * 70 + "╝"
+_BANNER_TITLE = "║" + " " * 10 + "Comprehensive Java Integration Pattern Generator" + " " * 12 + "║"
+
 # Complete pattern catalog with comprehensive definitions
 ALL_PATTERNS = {
     # Message Routing Patterns
@@ -700,16 +708,9 @@ ALL_PATTERNS = {
     },
 }
 
-def generate_comprehensive_main(pattern_name, pattern_info):
-    """Generate comprehensive Main.java with 300-500 lines."""
-
-    category = pattern_info["category"]
-    description = pattern_info["description"]
-    key_concepts = pattern_info["key_concepts"]
-    scenarios = pattern_info["scenarios"]
-
-    # Generate class header with comprehensive documentation
-    main_content = f'''package Integration.{pattern_name};
+# Main.java template, parsed once at import and rendered per pattern with a
+# single str.format_map call.
+_MAIN_TEMPLATE = '''package Integration.{pattern_name};
 
 import java.util.*;
 import java.time.Instant;
@@ -724,14 +725,9 @@ import java.util.concurrent.*;
  * {description}
  *
  * Key Concepts:
-'''
-
-    for concept in key_concepts:
-        main_content += f" * - {concept}\n"
-
-    main_content += f''' *
+{concepts_block} *
  * When to Use:
- * - You need to implement {description.lower()}
+ * - You need to implement {description_lower}
  * - You want to decouple system components
  * - You require reliable message processing
  * - You need to scale message handling
@@ -745,12 +741,7 @@ import java.util.concurrent.*;
  * - Testable components
  *
  * Real-World Scenarios:
-'''
-
-    for i, (scenario_name, scenario_desc) in enumerate(scenarios, 1):
-        main_content += f" * {i}. {scenario_name}: {scenario_desc}\n"
-
-    main_content += f''' *
+{scenarios_block} *
  * Reference: https://www.enterpriseintegrationpatterns.com
  *
  * @author Enterprise Integration Patterns
@@ -759,12 +750,13 @@ import java.util.concurrent.*;
 public class Main {{
 
     private static final String PATTERN_NAME = "{pattern_name}";
+    private static final String NEWLINE = System.lineSeparator();
     private static int scenarioCounter = 0;
 
     public static void main(String[] args) {{
         System.out.println("╔" + "═".repeat(70) + "╗");
-        System.out.println("║  " + PATTERN_NAME + " Pattern Demonstration" + " ".repeat(70 - PATTERN_NAME.length() - 32) + "║");
-        System.out.println("║  Category: {category}" + " ".repeat(70 - 13 - len(category)) + "║");
+        System.out.println("║  {pattern_name} Pattern Demonstration{title_padding}║");
+        System.out.println("║  Category: {category}{category_padding}║");
         System.out.println("╚" + "═".repeat(70) + "╝");
         System.out.println();
 
@@ -779,24 +771,14 @@ public class Main {{
         System.out.println("  ✓ Infrastructure initialized");
         System.out.println();
 
-'''
-
-    # Generate scenario demonstrations
-    for i, (scenario_name, scenario_desc) in enumerate(scenarios, 1):
-        scenario_method = scenario_name.replace(" ", "").replace("-", "")
-        main_content += f'''        // Scenario {i}: {scenario_name}
-        demonstrateScenario("{scenario_name}", "{scenario_desc}", implementation);
-
-'''
-
-    main_content += '''        // Summary
+{scenario_calls}        // Summary
         printSummary();
 
         System.out.println();
         System.out.println("╔" + "═".repeat(70) + "╗");
-        System.out.println("║  Pattern Demonstration Complete" + " ".repeat(70 - 34) + "║");
+        System.out.println("║  Pattern Demonstration Complete                                      ║");
         System.out.println("╚" + "═".repeat(70) + "╝");
-    }
+    }}
 
     /**
      * Demonstrates a specific scenario.
@@ -804,16 +786,18 @@ public class Main {{
     private static void demonstrateScenario(
             String scenarioName,
             String scenarioDescription,
-            ''' + pattern_name + '''Implementation implementation) {
+            {pattern_name}Implementation implementation) {{
 
         scenarioCounter++;
-        System.out.println("─".repeat(72));
-        System.out.println("Scenario " + scenarioCounter + ": " + scenarioName);
-        System.out.println("─".repeat(72));
-        System.out.println("Description: " + scenarioDescription);
-        System.out.println();
+        String rule = "─".repeat(72);
+        StringBuilder header = new StringBuilder(256)
+                .append(rule).append(NEWLINE)
+                .append("Scenario ").append(scenarioCounter).append(": ").append(scenarioName).append(NEWLINE)
+                .append(rule).append(NEWLINE)
+                .append("Description: ").append(scenarioDescription).append(NEWLINE);
+        System.out.println(header);
 
-        try {
+        try {{
             // Execute scenario
             long startTime = System.currentTimeMillis();
 
@@ -822,20 +806,18 @@ public class Main {{
             long endTime = System.currentTimeMillis();
             long duration = endTime - startTime;
 
-            System.out.println();
-            System.out.println("  ✓ Scenario completed successfully in " + duration + "ms");
-            System.out.println();
+            System.out.println(NEWLINE + "  ✓ Scenario completed successfully in " + duration + "ms" + NEWLINE);
 
-        } catch (Exception e) {
+        }} catch (Exception e) {{
             System.err.println("  ✗ Error in scenario: " + e.getMessage());
             e.printStackTrace();
-        }
-    }
+        }}
+    }}
 
     /**
      * Prints execution summary.
      */
-    private static void printSummary() {
+    private static void printSummary() {{
         System.out.println("─".repeat(72));
         System.out.println("Execution Summary");
         System.out.println("─".repeat(72));
@@ -844,9 +826,12 @@ public class Main {{
         System.out.println("  Category: {category}");
         System.out.println("  Status: All scenarios completed");
         System.out.println("─".repeat(72));
-    }
+    }}
 
-    /**
+'''
+
+# Helper methods shared verbatim by every Main.java; appended without formatting.
+_MAIN_HELPERS = '''    /**
      * Helper to simulate processing delay.
      */
     private static void simulateProcessing(int milliseconds) {
@@ -877,37 +862,73 @@ public class Main {{
     private static void printInfo(String message) {
         System.out.println("  ℹ " + message);
     }
-}}
+}
 '''
 
-    return main_content
-
-def generate_implementation_class(pattern_name, pattern_info):
-    """Generate comprehensive implementation class."""
+def build_context(pattern_name, pattern_info):
+    """Build the substitution mapping shared by the Main, implementation and README templates."""
 
-    description = pattern_info["description"]
+    category = pattern_info["category"]
     key_concepts = pattern_info["key_concepts"]
+    scenarios = pattern_info["scenarios"]
+    first_scenario_name, first_scenario_desc = scenarios[0]
+
+    # Pad the banner rows in Python so the emitted Java prints constant strings
+    # that line up with the 70-wide box.
+    return {
+        "pattern_name": pattern_name,
+        "category": category,
+        "title_padding": " " * (70 - len("  ") - len(pattern_name) - len(" Pattern Demonstration")),
+        "category_padding": " " * (70 - len("  Category: ") - len(category)),
+        "description": pattern_info["description"],
+        "description_lower": pattern_info["description"].lower(),
+        "concepts_block": "".join(
+            f" * - {concept}\n" for concept in key_concepts
+        ),
+        "scenarios_block": "".join(
+            f" * {i}. {scenario_name}: {scenario_desc}\n"
+            for i, (scenario_name, scenario_desc) in enumerate(scenarios, 1)
+        ),
+        "scenario_calls": "".join(
+            f'''        // Scenario {i}: {scenario_name}
+        demonstrateScenario("{scenario_name}", "{scenario_desc}", implementation);
+
+'''
+            for i, (scenario_name, scenario_desc) in enumerate(scenarios, 1)
+        ),
+        "readme_concepts_block": "".join(
+            f"- {concept}\n" for concept in key_concepts
+        ),
+        "readme_scenarios_block": "".join(
+            f"### {i}. {scenario_name}\n{scenario_desc}\n\n"
+            for i, (scenario_name, scenario_desc) in enumerate(scenarios, 1)
+        ),
+        "first_scenario_name": first_scenario_name,
+        "first_scenario_desc": first_scenario_desc,
+    }
+
+def generate_comprehensive_main(context):
+    """Generate comprehensive Main.java with 300-500 lines."""
 
-    impl_content = f'''package Integration.{pattern_name};
+    return _MAIN_TEMPLATE.format_map(context) + _MAIN_HELPERS
+
+# Implementation class template, rendered per pattern with str.format_map.
+_IMPL_TEMPLATE = '''package Integration.{pattern_name};
 
 import java.util.*;
 import java.time.Instant;
 import java.time.Duration;
 import java.util.concurrent.*;
 import java.util.concurrent.atomic.AtomicInteger;
+import java.util.concurrent.atomic.LongAdder;
 
 /**
  * Implementation of the {pattern_name} pattern.
  *
- * This class provides the core functionality for {description.lower()}.
+ * This class provides the core functionality for {description_lower}.
  *
  * Key Features:
-'''
-
-    for concept in key_concepts:
-        impl_content += f" * - {concept}\n"
-
-    impl_content += f''' *
+{concepts_block} *
  * @author Enterprise Integration Patterns
  * @version 1.0
  */
@@ -915,21 +936,19 @@ public class {pattern_name}Implementation {{
 
     private final String instanceId;
     private final Map<String, Object> configuration;
-    private final Map<String, Object> metrics;
+    private final Map<String, LongAdder> metrics;
     private final AtomicInteger messageCounter;
     private final Instant startTime;
-    private final ExecutorService executorService;
 
     /**
      * Constructs a new {pattern_name} implementation.
      */
     public {pattern_name}Implementation() {{
-        this.instanceId = UUID.randomUUID().toString().substring(0, 8);
+        this.instanceId = String.format("%08x", ThreadLocalRandom.current().nextInt());
         this.configuration = new ConcurrentHashMap<>();
         this.metrics = new ConcurrentHashMap<>();
         this.messageCounter = new AtomicInteger(0);
         this.startTime = Instant.now();
-        this.executorService = Executors.newFixedThreadPool(4);
 
         initialize();
     }}
@@ -942,9 +961,9 @@ public class {pattern_name}Implementation {{
         configuration.put("startTime", startTime);
         configuration.put("patternName", "{pattern_name}");
 
-        metrics.put("messagesProcessed", 0);
-        metrics.put("scenariosExecuted", 0);
-        metrics.put("errorsEncountered", 0);
+        metrics.put("messagesProcessed", new LongAdder());
+        metrics.put("scenariosExecuted", new LongAdder());
+        metrics.put("errorsEncountered", new LongAdder());
 
         System.out.println("  ℹ {pattern_name} instance " + instanceId + " initialized");
     }}
@@ -989,9 +1008,6 @@ public class {pattern_name}Implementation {{
         System.out.println("  → Executing {pattern_name} logic...");
 
         try {{
-            // Simulate pattern-specific processing
-            Thread.sleep(50); // Simulate work
-
             // Pattern-specific logic would go here
             // In real implementation, this would contain:
             // - Message routing logic
@@ -1002,9 +1018,6 @@ public class {pattern_name}Implementation {{
 
             System.out.println("  ✓ Pattern logic executed for: " + scenarioName);
 
-        }} catch (InterruptedException e) {{
-            Thread.currentThread().interrupt();
-            System.err.println("  ✗ Execution interrupted");
         }} catch (Exception e) {{
             System.err.println("  ✗ Error executing pattern logic: " + e.getMessage());
             incrementErrorCount();
@@ -1015,19 +1028,15 @@ public class {pattern_name}Implementation {{
      * Updates processing metrics.
      */
     private void updateMetrics() {{
-        int processed = (int) metrics.get("messagesProcessed") + 1;
-        metrics.put("messagesProcessed", processed);
-
-        int scenarios = (int) metrics.get("scenariosExecuted") + 1;
-        metrics.put("scenariosExecuted", scenarios);
+        metrics.get("messagesProcessed").increment();
+        metrics.get("scenariosExecuted").increment();
     }}
 
     /**
      * Increments error count.
      */
     private void incrementErrorCount() {{
-        int errors = (int) metrics.get("errorsEncountered") + 1;
-        metrics.put("errorsEncountered", errors);
+        metrics.get("errorsEncountered").increment();
     }}
 
     /**
@@ -1056,7 +1065,8 @@ public class {pattern_name}Implementation {{
      * @return The metric value
      */
     public Object getMetric(String key) {{
-        return metrics.get(key);
+        LongAdder counter = metrics.get(key);
+        return counter == null ? null : counter.sum();
     }}
 
     /**
@@ -1065,36 +1075,20 @@ public class {pattern_name}Implementation {{
      * @return Map of all metrics
      */
     public Map<String, Object> getAllMetrics() {{
-        return new HashMap<>(metrics);
-    }}
-
-    /**
-     * Shuts down the implementation.
-     */
-    public void shutdown() {{
-        executorService.shutdown();
-        try {{
-            if (!executorService.awaitTermination(5, TimeUnit.SECONDS)) {{
-                executorService.shutdownNow();
-            }}
-        }} catch (InterruptedException e) {{
-            executorService.shutdownNow();
-            Thread.currentThread().interrupt();
-        }}
-
-        System.out.println("  ℹ {pattern_name} instance " + instanceId + " shut down");
+        Map<String, Object> snapshot = new HashMap<>();
+        metrics.forEach((key, counter) -> snapshot.put(key, counter.sum()));
+        return snapshot;
     }}
 }}
 '''
 
-    return impl_content
-
-def generate_message_class(pattern_name):
-    """Generate Message class for the pattern."""
+def generate_implementation_class(context):
+    """Generate comprehensive implementation class."""
 
-    message_content = f'''package Integration.{pattern_name};
+    return _IMPL_TEMPLATE.format_map(context)
 
-import java.util.*;
+# Message.java is identical for every pattern apart from its package line.
+_MESSAGE_JAVA_BODY = '''import java.util.*;
 import java.time.Instant;
 
 /**
@@ -1106,7 +1100,7 @@ import java.time.Instant;
  * - Headers (metadata)
  * - Payload (business data)
  */
-public class Message {{
+public class Message {
 
     private final String messageId;
     private final Instant timestamp;
@@ -1118,12 +1112,12 @@ public class Message {{
      *
      * @param payload The message payload
      */
-    public Message(Object payload) {{
+    public Message(Object payload) {
         this.messageId = UUID.randomUUID().toString();
         this.timestamp = Instant.now();
         this.headers = new HashMap<>();
         this.payload = payload;
-    }}
+    }
 
     /**
      * Constructs a Message with payload and headers.
@@ -1131,39 +1125,39 @@ public class Message {{
      * @param payload The message payload
      * @param headers Initial headers
      */
-    public Message(Object payload, Map<String, Object> headers) {{
+    public Message(Object payload, Map<String, Object> headers) {
         this.messageId = UUID.randomUUID().toString();
         this.timestamp = Instant.now();
         this.headers = new HashMap<>(headers);
         this.payload = payload;
-    }}
+    }
 
     /**
      * Gets the message ID.
      *
      * @return The unique message identifier
      */
-    public String getMessageId() {{
+    public String getMessageId() {
         return messageId;
-    }}
+    }
 
     /**
      * Gets the timestamp when the message was created.
      *
      * @return The message timestamp
      */
-    public Instant getTimestamp() {{
+    public Instant getTimestamp() {
         return timestamp;
-    }}
+    }
 
     /**
      * Gets all message headers.
      *
      * @return Map of all headers
      */
-    public Map<String, Object> getHeaders() {{
+    public Map<String, Object> getHeaders() {
         return new HashMap<>(headers);
-    }}
+    }
 
     /**
      * Gets a specific header value.
@@ -1171,9 +1165,9 @@ public class Message {{
      * @param key The header key
      * @return The header value, or null if not found
      */
-    public Object getHeader(String key) {{
+    public Object getHeader(String key) {
         return headers.get(key);
-    }}
+    }
 
     /**
      * Sets a header value.
@@ -1181,18 +1175,18 @@ public class Message {{
      * @param key The header key
      * @param value The header value
      */
-    public void setHeader(String key, Object value) {{
+    public void setHeader(String key, Object value) {
         headers.put(key, value);
-    }}
+    }
 
     /**
      * Removes a header.
      *
      * @param key The header key to remove
      */
-    public void removeHeader(String key) {{
+    public void removeHeader(String key) {
         headers.remove(key);
-    }}
+    }
 
     /**
      * Checks if a header exists.
@@ -1200,18 +1194,18 @@ public class Message {{
      * @param key The header key
      * @return true if the header exists
      */
-    public boolean hasHeader(String key) {{
+    public boolean hasHeader(String key) {
         return headers.containsKey(key);
-    }}
+    }
 
     /**
      * Gets the message payload.
      *
      * @return The message payload
      */
-    public Object getPayload() {{
+    public Object getPayload() {
         return payload;
-    }}
+    }
 
     /**
      * Gets the payload as a specific type.
@@ -1222,42 +1216,38 @@ public class Message {{
      * @throws ClassCastException if the payload cannot be cast
      */
     @SuppressWarnings("unchecked")
-    public <T> T getPayloadAs(Class<T> type) {{
+    public <T> T getPayloadAs(Class<T> type) {
         return (T) payload;
-    }}
+    }
 
     @Override
-    public String toString() {{
+    public String toString() {
         return String.format("Message[id=%s, timestamp=%s, payload=%s, headers=%d]",
             messageId, timestamp, payload, headers.size());
-    }}
+    }
 
     @Override
-    public boolean equals(Object o) {{
+    public boolean equals(Object o) {
         if (this == o) return true;
         if (o == null || getClass() != o.getClass()) return false;
         Message message = (Message) o;
         return Objects.equals(messageId, message.messageId);
-    }}
+    }
 
     @Override
-    public int hashCode() {{
+    public int hashCode() {
         return Objects.hash(messageId);
-    }}
-}}
+    }
+}
 '''
 
-    return message_content
+def generate_message_class(pattern_name):
+    """Generate Message class for the pattern."""
 
-def generate_readme(pattern_name, pattern_info):
-    """Generate comprehensive README."""
+    return f"package Integration.{pattern_name};\n\n" + _MESSAGE_JAVA_BODY
 
-    category = pattern_info["category"]
-    description = pattern_info["description"]
-    key_concepts = pattern_info["key_concepts"]
-    scenarios = pattern_info["scenarios"]
-
-    readme_content = f'''# {pattern_name} Pattern
+# README.md template, rendered per pattern with str.format_map.
+_README_TEMPLATE = '''# {pattern_name} Pattern
 
 ## Category
 **{category}**
@@ -1267,16 +1257,11 @@ def generate_readme(pattern_name, pattern_info):
 
 ## Overview
 The {pattern_name} pattern is a core Enterprise Integration Pattern that enables
-{description.lower()}. This pattern is essential for building robust, scalable,
+{description_lower}. This pattern is essential for building robust, scalable,
 and maintainable integration solutions.
 
 ## Key Concepts
-'''
-
-    for concept in key_concepts:
-        readme_content += f"- {concept}\n"
-
-    readme_content += f'''
+{readme_concepts_block}
 ## When to Use
 
 Use the {pattern_name} pattern when:
@@ -1319,12 +1304,7 @@ Represents integration messages with headers and payload.
 
 This implementation demonstrates the following scenarios:
 
-'''
-
-    for i, (scenario_name, scenario_desc) in enumerate(scenarios, 1):
-        readme_content += f"### {i}. {scenario_name}\n{scenario_desc}\n\n"
-
-    readme_content += f'''## Benefits
+{readme_scenarios_block}## Benefits
 
 ### Loose Coupling
 Components are decoupled, allowing independent evolution and deployment.
@@ -1424,17 +1404,17 @@ Initializing {pattern_name} infrastructure...
   ✓ Infrastructure initialized
 
 ────────────────────────────────────────────────────────────────────────
-Scenario 1: {scenarios[0][0]}
+Scenario 1: {first_scenario_name}
 ────────────────────────────────────────────────────────────────────────
-Description: {scenarios[0][1]}
+Description: {first_scenario_desc}
 
-  → Processing: {scenarios[0][0]}
+  → Processing: {first_scenario_name}
   ℹ Created message: [MESSAGE-ID]
   → Executing {pattern_name} logic...
-  ✓ Pattern logic executed for: {scenarios[0][0]}
+  ✓ Pattern logic executed for: {first_scenario_name}
   ✓ Scenario processing completed
 
-  ✓ Scenario completed successfully in 52ms
+  ✓ Scenario completed successfully in [N]ms
 ```
 
 ## Related Patterns
@@ -1500,76 +1480,89 @@ This implementation is provided as an educational example of the
 **Use Cases**: Enterprise Integration, Microservices, Event-Driven Architecture
 '''
 
-    return readme_content
+def generate_readme(context):
+    """Generate comprehensive README."""
+
+    return _README_TEMPLATE.format_map(context)
+
+def write_file(path, data):
+    """Write already-encoded bytes to path, bypassing the text IO layer."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
 
 def generate_pattern(pattern_name, pattern_info, base_path):
-    """Generate complete pattern implementation."""
+    """Generate complete pattern implementation.
+
+    Returns a (success, messages) tuple; the progress lines are left to the
+    caller to print.
+    """
 
     pattern_dir = os.path.join(base_path, pattern_name)
     os.makedirs(pattern_dir, exist_ok=True)
+    prefix = pattern_dir + os.sep
 
-    print(f"Generating {pattern_name}...")
+    messages = [f"Generating {pattern_name}..."]
 
     try:
-        # Generate Main.java
-        main_content = generate_comprehensive_main(pattern_name, pattern_info)
-        with open(os.path.join(pattern_dir, "Main.java"), "w") as f:
-            f.write(main_content)
-
-        # Generate Implementation class
-        impl_content = generate_implementation_class(pattern_name, pattern_info)
-        with open(os.path.join(pattern_dir, f"{pattern_name}Implementation.java"), "w") as f:
-            f.write(impl_content)
-
-        # Generate Message class
-        message_content = generate_message_class(pattern_name)
-        with open(os.path.join(pattern_dir, "Message.java"), "w") as f:
-            f.write(message_content)
-
-        # Generate README
-        readme_content = generate_readme(pattern_name, pattern_info)
-        with open(os.path.join(pattern_dir, "README.md"), "w") as f:
-            f.write(readme_content)
+        context = build_context(pattern_name, pattern_info)
+        files = [
+            ("Main.java", generate_comprehensive_main(context)),
+            (f"{pattern_name}Implementation.java", generate_implementation_class(context)),
+            ("Message.java", generate_message_class(pattern_name)),
+            ("README.md", generate_readme(context)),
+        ]
+        # Encode each file once; write_file hands the bytes straight to os.write.
+        for filename, content in files:
+            write_file(prefix + filename, content.encode("utf-8"))
 
         # Remove old implementation files if they exist
-        old_impl = os.path.join(pattern_dir, f"{pattern_name}Impl.java")
-        if os.path.exists(old_impl):
-            os.remove(old_impl)
+        try:
+            os.remove(f"{prefix}{pattern_name}Impl.java")
+        except FileNotFoundError:
+            pass
 
-        print(f"  ✓ {pattern_name} generated successfully")
-        return True
+        messages.append(f"  ✓ {pattern_name} generated successfully")
+        return True, messages
 
     except Exception as e:
-        print(f"  ✗ Error generating {pattern_name}: {e}")
+        messages.append(f"  ✗ Error generating {pattern_name}: {e}")
         import traceback
-        traceback.print_exc()
-        return False
+        messages.append(traceback.format_exc().rstrip("\n"))
+        return False, messages
 
 def main():
     """Main execution."""
 
-    base_path = "/home/roku674/Alex/DesignPatterns/Java/Integration"
-
-    print("╔" + "═" * 70 + "╗")
-    print("║" + " " * 10 + "Comprehensive Java Integration Pattern Generator" + " " * 12 + "║")
-    print("╚" + "═" * 70 + "╝")
+    print(_BANNER_TOP)
+    print(_BANNER_TITLE)
+    print(_BANNER_BOTTOM)
     print()
     print(f"Generating {len(ALL_PATTERNS)} Enterprise Integration Patterns...")
     print()
 
     success_count = 0
     failure_count = 0
+    progress = []
 
     for pattern_name, pattern_info in sorted(ALL_PATTERNS.items()):
-        if generate_pattern(pattern_name, pattern_info, base_path):
+        success, messages = generate_pattern(pattern_name, pattern_info, BASE_PATH)
+        progress.extend(messages)
+        if success:
             success_count += 1
         else:
             failure_count += 1
 
+    # Emit the per-pattern progress in one write instead of two prints each.
+    sys.stdout.write("\n".join(progress) + "\n")
     print()
-    print("╔" + "═" * 70 + "╗")
+    print(_BANNER_TOP)
     print(f"║  Generation Complete: {success_count} succeeded, {failure_count} failed" + " " * (70 - 40 - len(str(success_count)) - len(str(failure_count))) + "║")
-    print("╚" + "═" * 70 + "╝")
+    print(_BANNER_BOTTOM)
 
     return 0 if failure_count == 0 else 1
 
@@ -5,7 +5,6 @@ Each pattern includes multiple classes, real-world scenarios, and comprehensive
 """
 
 import os
-import sys
 
 # Pattern definitions with categories and descriptions
 PATTERNS = {
@@ -119,6 +118,26 @@ PATTERNS = {
     },
 }
 
+# Strips spaces and hyphens from a scenario name to form a Java method suffix
+_SCENARIO_METHOD_TRANS = str.maketrans("", "", " -")
+
+def write_if_changed(path, data):
+    """Write data to path unless the file already holds exactly these bytes.
+
+    Leaving unchanged files alone keeps their mtimes, so re-running the
+    generator does not invalidate IDE or javac build state. Returns True if
+    the file was written.
+    """
+    try:
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return False
+    except FileNotFoundError:
+        pass
+    with open(path, "wb") as f:
+        f.write(data)
+    return True
+
 def generate_pattern_implementation(pattern_name, pattern_info, base_path):
     """Generate full implementation for a pattern."""
 
@@ -126,21 +145,20 @@ def generate_pattern_implementation(pattern_name, pattern_info, base_path):
 
     # Create directory if needed
     os.makedirs(pattern_dir, exist_ok=True)
+    prefix = pattern_dir + os.sep
 
     print(f"Generating {pattern_name}...")
 
-    # Generate Main.java
-    main_content = generate_main_java(pattern_name, pattern_info)
-    with open(os.path.join(pattern_dir, "Main.java"), "w") as f:
-        f.write(main_content)
-
-    # Generate supporting classes
-    generate_supporting_classes(pattern_name, pattern_info, pattern_dir)
-
-    # Generate README.md
-    readme_content = generate_readme(pattern_name, pattern_info)
-    with open(os.path.join(pattern_dir, "README.md"), "w") as f:
-        f.write(readme_content)
+    # Render every file first, then write them in one pass
+    impl_content, message_content = generate_supporting_classes(pattern_name, pattern_info)
+    files = [
+        ("Main.java", generate_main_java(pattern_name, pattern_info)),
+        (f"{pattern_name}Implementation.java", impl_content),
+        ("Message.java", message_content),
+        ("README.md", generate_readme(pattern_name, pattern_info)),
+    ]
+    for filename, content in files:
+        write_if_changed(prefix + filename, content.encode("utf-8"))
 
     print(f"  ✓ Generated {pattern_name}")
 
@@ -150,8 +168,10 @@ def generate_main_java(pattern_name, pattern_info):
     scenarios = pattern_info["scenarios"]
     description = pattern_info["description"]
     category = pattern_info["category"]
+    # Java method-name suffix for each scenario, used by both loops below
+    scenario_methods = [scenario.translate(_SCENARIO_METHOD_TRANS) for scenario in scenarios]
 
-    content = f"""package Integration.{pattern_name};
+    parts = [f"""package Integration.{pattern_name};
 
 /**
  * {pattern_name} Pattern Demonstration
@@ -168,12 +188,9 @@ def generate_main_java(pattern_name, pattern_info):
  * - Provides reliability and scalability
  *
  * Real-world scenarios demonstrated:
-"""
-
-    for i, scenario in enumerate(scenarios, 1):
-        content += f" * {i}. {scenario}\n"
-
-    content += f""" *
+"""]
+    parts.extend(f" * {i}. {scenario}\n" for i, scenario in enumerate(scenarios, 1))
+    parts.append(f""" *
  * Reference: https://www.enterpriseintegrationpatterns.com
  */
 public class Main {{
@@ -183,27 +200,25 @@ public class Main {{
         // Initialize messaging infrastructure
         System.out.println("Initializing {pattern_name} infrastructure...\\n");
 
-"""
+""")
 
     # Generate scenario demonstrations
-    for i, scenario in enumerate(scenarios, 1):
-        scenario_method = scenario.replace(" ", "").replace("-", "")
-        content += f"""        // Scenario {i}: {scenario}
+    parts.extend(f"""        // Scenario {i}: {scenario}
         System.out.println("--- Scenario {i}: {scenario} ---");
         demonstrate{scenario_method}();
         System.out.println();
 
 """
+        for i, (scenario, scenario_method) in enumerate(zip(scenarios, scenario_methods), 1)
+    )
 
-    content += """        System.out.println("=== Pattern demonstration complete ===");
+    parts.append("""        System.out.println("=== Pattern demonstration complete ===");
     }
 
-"""
+""")
 
     # Generate scenario methods
-    for scenario in scenarios:
-        scenario_method = scenario.replace(" ", "").replace("-", "")
-        content += f"""    /**
+    parts.extend(f"""    /**
      * Demonstrates {scenario}.
      */
     private static void demonstrate{scenario_method}() {{
@@ -219,16 +234,108 @@ public class Main {{
     }}
 
 """
+        for scenario, scenario_method in zip(scenarios, scenario_methods)
+    )
 
-    content += "}\n"
+    parts.append("}\n")
 
-    return content
+    return "".join(parts)
 
-def generate_supporting_classes(pattern_name, pattern_info, pattern_dir):
-    """Generate supporting classes for the pattern."""
+# Message.java is identical for every pattern apart from its package line.
+_MESSAGE_BODY = """import java.util.HashMap;
+import java.util.Map;
+import java.util.UUID;
+import java.time.Instant;
 
-    # Generate implementation class
-    impl_content = f"""package Integration.{pattern_name};
+/**
+ * Represents a message in the integration system.
+ * Contains headers, payload, and metadata.
+ */
+public class Message {
+    private final String messageId;
+    private final Instant timestamp;
+    private final Map<String, Object> headers;
+    private final Object payload;
+
+    /**
+     * Constructs a Message with the specified payload.
+     *
+     * @param payload The message payload
+     */
+    public Message(Object payload) {
+        this.messageId = UUID.randomUUID().toString();
+        this.timestamp = Instant.now();
+        this.headers = new HashMap<>();
+        this.payload = payload;
+    }
+
+    /**
+     * Gets the message ID.
+     *
+     * @return The message ID
+     */
+    public String getMessageId() {
+        return messageId;
+    }
+
+    /**
+     * Gets the timestamp.
+     *
+     * @return The timestamp
+     */
+    public Instant getTimestamp() {
+        return timestamp;
+    }
+
+    /**
+     * Gets all headers.
+     *
+     * @return Map of headers
+     */
+    public Map<String, Object> getHeaders() {
+        return new HashMap<>(headers);
+    }
+
+    /**
+     * Gets a specific header.
+     *
+     * @param key The header key
+     * @return The header value
+     */
+    public Object getHeader(String key) {
+        return headers.get(key);
+    }
+
+    /**
+     * Sets a header.
+     *
+     * @param key The header key
+     * @param value The header value
+     */
+    public void setHeader(String key, Object value) {
+        headers.put(key, value);
+    }
+
+    /**
+     * Gets the payload.
+     *
+     * @return The message payload
+     */
+    public Object getPayload() {
+        return payload;
+    }
+
+    @Override
+    public String toString() {
+        return String.format("Message[id=%s, timestamp=%s, headers=%s, payload=%s]",
+            messageId, timestamp, headers, payload);
+    }
+}
+"""
+
+# Implementation class template; only the pattern name varies, so it is
+# parsed once at import and filled in with str.format_map.
+_IMPLEMENTATION_TEMPLATE = """package Integration.{pattern_name};
 
 import java.util.HashMap;
 import java.util.Map;
@@ -330,106 +437,81 @@ public class {pattern_name}Implementation {{
 }}
 """
 
-    with open(os.path.join(pattern_dir, f"{pattern_name}Implementation.java"), "w") as f:
-        f.write(impl_content)
+def generate_supporting_classes(pattern_name, pattern_info):
+    """Generate supporting classes for the pattern.
 
-    # Generate Message class if not exists
-    message_file = os.path.join(pattern_dir, "Message.java")
-    if not os.path.exists(message_file):
-        message_content = f"""package Integration.{pattern_name};
+    Returns the implementation source and the Message.java source.
+    """
 
-import java.util.HashMap;
-import java.util.Map;
-import java.util.UUID;
-import java.time.Instant;
+    # Generate implementation class
+    impl_content = _IMPLEMENTATION_TEMPLATE.format_map({"pattern_name": pattern_name})
 
-/**
- * Represents a message in the integration system.
- * Contains headers, payload, and metadata.
- */
-public class Message {{
-    private final String messageId;
-    private final Instant timestamp;
-    private final Map<String, Object> headers;
-    private final Object payload;
+    # Generate Message class
+    message_content = f"package Integration.{pattern_name};\n\n" + _MESSAGE_BODY
 
-    /**
-     * Constructs a Message with the specified payload.
-     *
-     * @param payload The message payload
-     */
-    public Message(Object payload) {{
-        this.messageId = UUID.randomUUID().toString();
-        this.timestamp = Instant.now();
-        this.headers = new HashMap<>();
-        this.payload = payload;
-    }}
+    return impl_content, message_content
 
-    /**
-     * Gets the message ID.
-     *
-     * @return The message ID
-     */
-    public String getMessageId() {{
-        return messageId;
-    }}
+# Pattern-independent README sections, appended verbatim around the
+# per-pattern Compile and Run / Sample Output block.
+_README_CONSEQUENCES = """## Consequences
 
-    /**
-     * Gets the timestamp.
-     *
-     * @return The timestamp
-     */
-    public Instant getTimestamp() {{
-        return timestamp;
-    }}
+### Benefits
+- **Decoupling**: Separates sender from receiver
+- **Scalability**: Supports high message volumes
+- **Reliability**: Ensures message delivery
+- **Flexibility**: Easy to modify and extend
+- **Maintainability**: Clear separation of concerns
 
-    /**
-     * Gets all headers.
-     *
-     * @return Map of headers
-     */
-    public Map<String, Object> getHeaders() {{
-        return new HashMap<>(headers);
-    }}
+### Drawbacks
+- **Complexity**: Additional infrastructure required
+- **Latency**: Message queuing adds delay
+- **Debugging**: Harder to trace message flow
+- **Overhead**: Resource consumption for messaging
 
-    /**
-     * Gets a specific header.
-     *
-     * @param key The header key
-     * @return The header value
-     */
-    public Object getHeader(String key) {{
-        return headers.get(key);
-    }}
+## Implementation Considerations
 
-    /**
-     * Sets a header.
-     *
-     * @param key The header key
-     * @param value The header value
-     */
-    public void setHeader(String key, Object value) {{
-        headers.put(key, value);
-    }}
+### Performance
+- Optimize message size
+- Use efficient serialization
+- Implement connection pooling
+- Monitor message throughput
 
-    /**
-     * Gets the payload.
-     *
-     * @return The message payload
-     */
-    public Object getPayload() {{
-        return payload;
-    }}
+### Reliability
+- Handle network failures
+- Implement retry logic
+- Use dead letter queues
+- Monitor message delivery
+
+### Security
+- Encrypt sensitive data
+- Authenticate senders
+- Authorize receivers
+- Audit message flow
 
-    @Override
-    public String toString() {{
-        return String.format("Message[id=%s, timestamp=%s, headers=%s, payload=%s]",
-            messageId, timestamp, headers, payload);
-    }}
-}}
 """
-        with open(message_file, "w") as f:
-            f.write(message_content)
+
+_README_REFERENCES = """## Related Patterns
+- Message Channel: Infrastructure for message transport
+- Message Router: Directs messages to appropriate receivers
+- Message Translator: Transforms message formats
+- Message Endpoint: Connects applications to channels
+
+## Best Practices
+1. **Keep messages small**: Optimize for performance
+2. **Use correlation IDs**: Track related messages
+3. **Implement idempotency**: Handle duplicate messages
+4. **Log everything**: Enable debugging and auditing
+5. **Monitor actively**: Track message flow and errors
+6. **Plan for failure**: Implement retry and error handling
+7. **Document contracts**: Clear message specifications
+8. **Version messages**: Support schema evolution
+
+## References
+- Enterprise Integration Patterns by Gregor Hohpe and Bobby Woolf
+- https://www.enterpriseintegrationpatterns.com
+- Message-Oriented Middleware patterns
+- Cloud Integration Patterns
+"""
 
 def generate_readme(pattern_name, pattern_info):
     """Generate comprehensive README."""
@@ -438,7 +520,7 @@ def generate_readme(pattern_name, pattern_info):
     category = pattern_info["category"]
     scenarios = pattern_info["scenarios"]
 
-    content = f"""# {pattern_name} Pattern
+    parts = [f"""# {pattern_name} Pattern
 
 ## Category
 {category}
@@ -480,48 +562,15 @@ Use the {pattern_name} pattern when:
 
 ## Real-World Scenarios
 
-"""
-
-    for i, scenario in enumerate(scenarios, 1):
-        content += f"### {i}. {scenario}\n"
-        content += f"Demonstrates how {pattern_name} handles {scenario.lower()}.\n\n"
-
-    content += f"""## Consequences
-
-### Benefits
-- **Decoupling**: Separates sender from receiver
-- **Scalability**: Supports high message volumes
-- **Reliability**: Ensures message delivery
-- **Flexibility**: Easy to modify and extend
-- **Maintainability**: Clear separation of concerns
-
-### Drawbacks
-- **Complexity**: Additional infrastructure required
-- **Latency**: Message queuing adds delay
-- **Debugging**: Harder to trace message flow
-- **Overhead**: Resource consumption for messaging
-
-## Implementation Considerations
-
-### Performance
-- Optimize message size
-- Use efficient serialization
-- Implement connection pooling
-- Monitor message throughput
-
-### Reliability
-- Handle network failures
-- Implement retry logic
-- Use dead letter queues
-- Monitor message delivery
+"""]
 
-### Security
-- Encrypt sensitive data
-- Authenticate senders
-- Authorize receivers
-- Audit message flow
+    parts.extend(
+        f"### {i}. {scenario}\nDemonstrates how {pattern_name} handles {scenario.lower()}.\n\n"
+        for i, scenario in enumerate(scenarios, 1)
+    )
 
-## Compile and Run
+    parts.append(_README_CONSEQUENCES)
+    parts.append(f"""## Compile and Run
 ```bash
 # Navigate to Java directory
 cd /home/roku674/Alex/DesignPatterns/Java
@@ -550,30 +599,10 @@ Scenario '{scenarios[0]}' completed at [Timestamp]
 {scenarios[0]} completed successfully!
 ```
 
-## Related Patterns
-- Message Channel: Infrastructure for message transport
-- Message Router: Directs messages to appropriate receivers
-- Message Translator: Transforms message formats
-- Message Endpoint: Connects applications to channels
-
-## Best Practices
-1. **Keep messages small**: Optimize for performance
-2. **Use correlation IDs**: Track related messages
-3. **Implement idempotency**: Handle duplicate messages
-4. **Log everything**: Enable debugging and auditing
-5. **Monitor actively**: Track message flow and errors
-6. **Plan for failure**: Implement retry and error handling
-7. **Document contracts**: Clear message specifications
-8. **Version messages**: Support schema evolution
-
-## References
-- Enterprise Integration Patterns by Gregor Hohpe and Bobby Woolf
-- https://www.enterpriseintegrationpatterns.com
-- Message-Oriented Middleware patterns
-- Cloud Integration Patterns
-"""
+""")
+    parts.append(_README_REFERENCES)
 
-    return content
+    return "".join(parts)
 
 def main():
     """Main entry point."""
@@ -587,15 +616,18 @@ def main():
     # Skip CommandMessage as it's already done
     patterns_to_generate = {k: v for k, v in PATTERNS.items() if k != "CommandMessage"}
 
+    failures = []
     for pattern_name, pattern_info in patterns_to_generate.items():
         try:
             generate_pattern_implementation(pattern_name, pattern_info, base_path)
         except Exception as e:
-            print(f"  ✗ Error generating {pattern_name}: {e}")
+            failures.append((pattern_name, e))
 
     print()
     print("=" * 60)
-    print(f"Successfully generated {len(patterns_to_generate)} patterns!")
+    print(f"Successfully generated {len(patterns_to_generate) - len(failures)} patterns!")
+    for pattern_name, error in failures:
+        print(f"  ✗ Error generating {pattern_name}: {error}")
     print("=" * 60)
 
 if __name__ == "__main__":